@@ -7,6 +7,7 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryError
 
 from .coordinator import ThermoWorksCoordinator
 
@@ -21,7 +22,8 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ThermoWorksConfigEntry
 ) -> bool:
     """Set up ThermoWorks BLE device from a config entry."""
-    assert entry.unique_id is not None
+    if entry.unique_id is None:
+        raise ConfigEntryError("Config entry has no device address")
     _LOGGER.info("Setting up ThermoWorks integration for %s", entry.unique_id)
     coordinator = ThermoWorksCoordinator(hass, entry)
     entry.runtime_data = coordinator
@@ -29,9 +31,10 @@ async def async_setup_entry(
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     # Only start after all platforms have had a chance to subscribe.
     _LOGGER.info("Starting coordinator...")
+    entry.async_on_unload(coordinator.async_stop)
     entry.async_on_unload(coordinator.async_start())
-    # Start fallback timer-based polling to ensure updates even without advertisements
-    coordinator.start_fallback_poll()
+    # Repeated advertisements are deduplicated, so they can't drive every poll.
+    entry.async_on_unload(coordinator.async_start_poll_timer())
     _LOGGER.info("ThermoWorks integration setup complete")
     return True
 
@@ -40,32 +40,65 @@ def _device_key_to_bluetooth_entity_key(
     return PassiveBluetoothEntityKey(device_key.key, device_key.device_id)
 
 
+type _StaticUpdateParts = tuple[
+    dict[DeviceKey, PassiveBluetoothEntityKey],
+    dict[PassiveBluetoothEntityKey, BinarySensorEntityDescription],
+    dict[PassiveBluetoothEntityKey, str | None],
+]
+
+# Binary sensor descriptions and names are fixed per sensor key (see
+# ThermoWorksBluetoothDeviceData._apply_reading), so everything except the
+# values is cached by the set of keys in the update.
+_STATIC_UPDATE_CACHE: dict[frozenset[DeviceKey], _StaticUpdateParts] = {}
+
+
+def _static_update_parts(sensor_update: SensorUpdate) -> _StaticUpdateParts:
+    """Return the entity keys, descriptions and names for a sensor update."""
+    descriptions = sensor_update.binary_entity_descriptions
+    values = sensor_update.binary_entity_values
+    cache_key = frozenset(descriptions.keys() | values.keys())
+    if (cached := _STATIC_UPDATE_CACHE.get(cache_key)) is not None:
+        return cached
+
+    entity_keys = {
+        device_key: _device_key_to_bluetooth_entity_key(device_key)
+        for device_key in cache_key
+    }
+    entity_descriptions: dict[
+        PassiveBluetoothEntityKey, BinarySensorEntityDescription
+    ] = {}
+    for device_key, description in descriptions.items():
+        entity_description = BINARY_SENSOR_DESCRIPTIONS.get(description.device_class)
+        if entity_description is not None:
+            entity_descriptions[entity_keys[device_key]] = entity_description
+    entity_names = {
+        entity_keys[device_key]: sensor_values.name
+        for device_key, sensor_values in values.items()
+    }
+
+    cached = (entity_keys, entity_descriptions, entity_names)
+    _STATIC_UPDATE_CACHE[cache_key] = cached
+    return cached
+
+
 def binary_sensor_update_to_bluetooth_data_update(
     sensor_update: SensorUpdate,
 ) -> PassiveBluetoothDataUpdate:
     """Convert a sensor update to a bluetooth data update for binary sensors."""
+    entity_keys, entity_descriptions, entity_names = _static_update_parts(
+        sensor_update
+    )
     return PassiveBluetoothDataUpdate(
         devices={
             device_id: sensor_device_info_to_hass_device_info(device_info)
             for device_id, device_info in sensor_update.devices.items()
         },
-        entity_descriptions={
-            _device_key_to_bluetooth_entity_key(
-                device_key
-            ): BINARY_SENSOR_DESCRIPTIONS[description.device_class]
-            for device_key, description in sensor_update.binary_entity_descriptions.items()
-            if description.device_class in BINARY_SENSOR_DESCRIPTIONS
-        },
+        entity_descriptions=entity_descriptions,
         entity_data={
-            _device_key_to_bluetooth_entity_key(
-                device_key
-            ): sensor_values.native_value
-            for device_key, sensor_values in sensor_update.binary_entity_values.items()
-        },
-        entity_names={
-            _device_key_to_bluetooth_entity_key(device_key): sensor_values.name
+            entity_keys[device_key]: sensor_values.native_value
             for device_key, sensor_values in sensor_update.binary_entity_values.items()
         },
+        entity_names=entity_names,
     )
 
 
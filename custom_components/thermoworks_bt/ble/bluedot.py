@@ -5,12 +5,27 @@ from __future__ import annotations
 import struct
 from dataclasses import dataclass
 
+# Advertised local name prefix for BlueDOT devices.
+BLUEDOT_NAME_PREFIX = "BlueDOT"
+
 # GATT characteristic UUID for BlueDOT temperature notifications.
 CHARACTERISTIC_UUID = "783f2991-23e0-4bdc-ac16-78601bd84b39"
 
 # Expected notification payload length.
 NOTIFICATION_DATA_LENGTH = 20
 
+# Notification payload layout (see parse_notification_data); byte 12 is
+# unknown and skipped.
+_PAYLOAD_STRUCT = struct.Struct("<BiiBBBx6sB")
+
+# Precomputed Celsius values for whole Fahrenheit degrees from -80 to 999,
+# indexed by temperature + _F_TO_C_OFFSET. This covers everything a BlueDOT
+# probe can report; anything outside it is converted on the fly.
+_F_TO_C_OFFSET = 80
+_F_TO_C = tuple(
+    round((temp - 32) * 5 / 9, 1) for temp in range(-_F_TO_C_OFFSET, 1000)
+)
+
 # Probe status values.
 PROBE_CONNECTED = 0x00
 PROBE_DISCONNECTED = 0x03
@@ -26,15 +41,24 @@ class BlueDOTReading:
 
     probe_connected: bool
     temperature_celsius: float
-    alarm_temperature_celsius: float
+    alarm_temperature_raw: int
     alarm_silenced: bool
     alarm_disabled: bool
     device_unit_fahrenheit: bool
     mac_address: bytes
     alarm_active: bool
 
+    @property
+    def alarm_temperature_celsius(self) -> float:
+        """Return the alarm temperature in Celsius.
 
-def parse_notification_data(data: bytes) -> BlueDOTReading:
+        The integration doesn't expose the alarm temperature, so it is only
+        converted when something asks for it.
+        """
+        return _to_celsius(self.alarm_temperature_raw, self.device_unit_fahrenheit)
+
+
+def parse_notification_data(data: bytes | bytearray | memoryview) -> BlueDOTReading:
     """Parse a 20-byte BlueDOT notification payload.
 
     Byte layout:
@@ -49,7 +73,8 @@ def parse_notification_data(data: bytes) -> BlueDOTReading:
         19:     Alarm active (0=no, 1=yes)
 
     Args:
-        data: Raw 20-byte notification payload.
+        data: Raw 20-byte notification payload. Any bytes-like object is
+            accepted, so bleak's bytearray can be passed without copying.
 
     Returns:
         Parsed BlueDOTReading with temperature always in Celsius.
@@ -57,33 +82,36 @@ def parse_notification_data(data: bytes) -> BlueDOTReading:
     Raises:
         ValueError: If data is not the expected length.
     """
-    if len(data) != NOTIFICATION_DATA_LENGTH:
+    # Struct checks the length itself, so the happy path needs no len() call.
+    try:
+        (
+            probe_status,
+            raw_temp,
+            raw_alarm_temp,
+            alarm_silenced,
+            alarm_disabled,
+            unit,
+            mac_address,
+            alarm_active,
+        ) = _PAYLOAD_STRUCT.unpack(data)
+    except struct.error as err:
         raise ValueError(
             f"Expected {NOTIFICATION_DATA_LENGTH} bytes, got {len(data)}"
-        )
-
-    probe_status = data[0]
-    raw_temp = struct.unpack_from("<i", data, 1)[0]
-    raw_alarm_temp = struct.unpack_from("<i", data, 5)[0]
-    alarm_silenced = data[9] != 0
-    alarm_disabled = data[10] != 0
-    unit = data[11]
-    mac_address = data[13:19]
-    alarm_active = data[19] != 0
+        ) from err
 
     is_fahrenheit = unit == UNIT_FAHRENHEIT
     temperature = _to_celsius(raw_temp, is_fahrenheit)
-    alarm_temperature = _to_celsius(raw_alarm_temp, is_fahrenheit)
 
+    # Positional in field order; keywords cost ~20% more per reading.
     return BlueDOTReading(
-        probe_connected=probe_status == PROBE_CONNECTED,
-        temperature_celsius=temperature,
-        alarm_temperature_celsius=alarm_temperature,
-        alarm_silenced=alarm_silenced,
-        alarm_disabled=alarm_disabled,
-        device_unit_fahrenheit=is_fahrenheit,
-        mac_address=mac_address,
-        alarm_active=alarm_active,
+        probe_status == PROBE_CONNECTED,
+        temperature,
+        raw_alarm_temp,
+        alarm_silenced != 0,
+        alarm_disabled != 0,
+        is_fahrenheit,
+        mac_address,
+        alarm_active != 0,
     )
 
 
@@ -98,6 +126,9 @@ def _to_celsius(temp: int, is_fahrenheit: bool) -> float:
         Temperature in Celsius.
     """
     if is_fahrenheit:
+        index = temp + _F_TO_C_OFFSET
+        if 0 <= index < len(_F_TO_C):
+            return _F_TO_C[index]
         return round((temp - 32) * 5 / 9, 1)
     return float(temp)
 
@@ -111,6 +142,4 @@ def is_bluedot(name: str | None) -> bool:
     Returns:
         True if the name indicates a BlueDOT device.
     """
-    if name is None:
-        return False
-    return name.startswith("BlueDOT")
+    return name is not None and name.startswith(BLUEDOT_NAME_PREFIX)
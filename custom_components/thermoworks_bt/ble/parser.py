@@ -7,8 +7,8 @@ import logging
 from typing import TYPE_CHECKING
 
 from bleak import BleakClient
+from bleak.exc import BleakError
 from bleak_retry_connector import establish_connection
-from bluetooth_data_tools import monotonic_time_coarse
 from bluetooth_sensor_state_data import BluetoothData
 from sensor_state_data import BinarySensorDeviceClass, SensorLibrary, SensorUpdate
 
@@ -20,23 +20,34 @@ from .bluedot import (
 )
 
 if TYPE_CHECKING:
+    from bleak.backends.characteristic import BleakGATTCharacteristic
     from bleak.backends.device import BLEDevice
     from bluetooth_sensor_state_data import BluetoothServiceInfoBleak
 
 _LOGGER = logging.getLogger(__name__)
 
-# Minimum seconds between polls to avoid hammering the device.
-MIN_POLL_INTERVAL = 30.0
-
 # Timeout in seconds for waiting for a notification after subscribing.
 NOTIFICATION_TIMEOUT = 10.0
 
+# Seconds an idle connection is kept open for reuse by the next poll. Must
+# stay above the coordinator's poll interval, including its first backoff
+# step, or every poll pays for a fresh connection.
+IDLE_DISCONNECT_TIMEOUT = 45.0
+
 
 class ThermoWorksBluetoothDeviceData(BluetoothData):
     """Parse and poll ThermoWorks BLE devices."""
 
     def __init__(self) -> None:
         super().__init__()
+        self._client: BleakClient | None = None
+        # Characteristic subscribed on the current connection, if any.
+        self._notify_char: BleakGATTCharacteristic | str | None = None
+        self._idle_timer: asyncio.TimerHandle | None = None
+        self._disconnect_task: asyncio.Task[None] | None = None
+        # Raw notification payloads; None marks the end of a connection.
+        self._raw_queue: asyncio.Queue[bytearray | None] = asyncio.Queue()
+        self._identified = False
 
     def _start_update(self, data: BluetoothServiceInfoBleak) -> None:
         """Handle BLE advertisement data.
@@ -47,56 +58,65 @@ class ThermoWorksBluetoothDeviceData(BluetoothData):
 
         Note: RSSI is automatically updated by the base class after this method.
         """
-        _LOGGER.debug(
-            "_start_update called for device: name='%s', address=%s, RSSI=%d",
-            data.name, data.address, data.rssi
-        )
+        # Device metadata never changes once set.
+        if self._identified:
+            return
+
         is_supported = is_bluedot(data.name)
-        _LOGGER.debug("  is_bluedot('%s') = %s", data.name, is_supported)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Advertisement from name='%s', address=%s, RSSI=%d, supported=%s",
+                data.name,
+                data.address,
+                data.rssi,
+                is_supported,
+            )
 
         if is_supported:
-            _LOGGER.debug("  Setting device metadata for BlueDOT")
             self.set_device_type("BlueDOT")
             self.set_device_name(data.name)
             self.set_device_manufacturer("ThermoWorks")
-        else:
-            _LOGGER.debug("  Not a BlueDOT device, skipping")
+            self._identified = True
 
     def poll_needed(
-        self, service_info: BluetoothServiceInfoBleak, last_poll: float | None
+        self,
+        service_info: BluetoothServiceInfoBleak,
+        last_poll: float | None,
+        min_interval: float,
     ) -> bool:
         """Return True if enough time has passed since the last poll.
 
         Args:
             service_info: Latest BLE service info (unused but required by API).
-            last_poll: Timestamp of last successful poll, or None.
+            last_poll: Seconds since the last poll attempt, or None.
+            min_interval: Minimum seconds between polls, chosen by the caller.
 
         Returns:
             True if a new poll should be initiated.
         """
-        now = monotonic_time_coarse()
+        needed = last_poll is None or last_poll > min_interval
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return needed
+
         if last_poll is None:
             _LOGGER.debug(
                 "Poll needed for %s: no previous poll", self.get_device_name()
             )
-            return True
-
-        time_since_poll = now - last_poll
-        needed = time_since_poll > MIN_POLL_INTERVAL
-        _LOGGER.debug(
-            "Poll needed check for %s: %.1fs since last poll (min: %.1fs) -> %s",
-            self.get_device_name(),
-            time_since_poll,
-            MIN_POLL_INTERVAL,
-            needed,
-        )
+        else:
+            _LOGGER.debug(
+                "Poll needed check for %s: %.1fs since last poll (min: %.1fs) -> %s",
+                self.get_device_name(),
+                last_poll,
+                min_interval,
+                needed,
+            )
         return needed
 
     async def async_poll(self, ble_device: BLEDevice) -> SensorUpdate:
         """Connect to the device and read temperature data.
 
-        Connects via GATT, subscribes to notifications, waits for one reading,
-        parses it, and disconnects.
+        Connects via GATT (or reuses a connection from a recent poll), waits
+        for one notification and parses it.
 
         Args:
             ble_device: The BLE device to connect to.
@@ -135,7 +155,12 @@ class ThermoWorksBluetoothDeviceData(BluetoothData):
     async def _async_connect_and_read(
         self, ble_device: BLEDevice
     ) -> BlueDOTReading:
-        """Connect to a BlueDOT and read one notification.
+        """Read the newest notification from a BlueDOT.
+
+        Reuses the connection from a recent poll if one is still open.
+        The connection and notification subscription are kept open after the
+        read and closed by an idle timer if no further poll arrives within
+        IDLE_DISCONNECT_TIMEOUT seconds.
 
         Args:
             ble_device: The BLE device to connect to.
@@ -144,70 +169,232 @@ class ThermoWorksBluetoothDeviceData(BluetoothData):
             Parsed BlueDOTReading from the notification.
 
         Raises:
-            asyncio.TimeoutError: If no notification is received in time.
+            TimeoutError: If no notification is received in time.
             BleakError: On connection failure.
         """
-        from bleak.exc import BleakError
+        self._cancel_idle_timer()
+        try:
+            await self._ensure_connected(ble_device)
+            async with asyncio.timeout(NOTIFICATION_TIMEOUT):
+                reading = await self._async_read_notification()
+            _LOGGER.debug("Notification received successfully")
+        except Exception:
+            # Drop a connection that failed to deliver; the next poll
+            # reconnects from scratch.
+            self._start_disconnect()
+            raise
+        finally:
+            self._schedule_idle_disconnect()
 
-        _LOGGER.debug("Connecting to %s", ble_device.address)
-        reading_event = asyncio.Event()
-        reading: BlueDOTReading | None = None
+        return reading
 
-        def _on_notification(_sender: int, data: bytearray) -> None:
-            nonlocal reading
-            _LOGGER.debug("Received notification: %s", data.hex())
-            try:
-                reading = parse_notification_data(bytes(data))
+    async def _async_read_notification(self) -> BlueDOTReading:
+        """Wait for notifications and parse the newest valid one.
+
+        The device may have sent several notifications since the last poll;
+        all queued payloads are drained and parsed newest first, so older
+        ones are only parsed if a newer one is malformed. If none of them
+        parse, the next notification is awaited.
+
+        Returns:
+            Parsed BlueDOTReading from the newest valid notification.
+
+        Raises:
+            BleakError: If the connection is lost before a valid notification
+                arrives.
+        """
+        if self._client is None:
+            raise BleakError("Disconnected before a notification arrived")
+        queue = self._raw_queue
+        while True:
+            batch = [await queue.get()]
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            # Nothing is queued after the end marker, so it can only be last.
+            disconnected = batch[-1] is None
+            if disconnected:
+                batch.pop()
+            for data in reversed(batch):
+                try:
+                    reading = parse_notification_data(data)
+                except ValueError:
+                    _LOGGER.warning(
+                        "Failed to parse notification data from %s: %s",
+                        self.get_device_name(),
+                        data.hex(),
+                    )
+                    continue
                 _LOGGER.debug("Parsed reading: %s", reading)
-            except ValueError:
-                _LOGGER.warning(
-                    "Failed to parse notification data from %s: %s",
-                    ble_device.address,
-                    data.hex(),
-                )
-                return
-            reading_event.set()
+                return reading
+            if disconnected:
+                raise BleakError("Disconnected before a notification arrived")
+
+    async def _ensure_connected(self, ble_device: BLEDevice) -> BleakClient:
+        """Return a connected client with notifications subscribed.
+
+        Args:
+            ble_device: The BLE device to connect to.
+
+        Returns:
+            The connected BleakClient.
 
-        client = await establish_connection(
-            BleakClient, ble_device, ble_device.address
+        Raises:
+            BleakError: On connection failure.
+        """
+        client = self._client
+        if client is None or not client.is_connected:
+            # Let a previous connection finish closing before opening another.
+            await self._async_wait_disconnected()
+            _LOGGER.debug("Connecting to %s", ble_device.address)
+            self._reset_connection_state()
+            client = await establish_connection(
+                BleakClient,
+                ble_device,
+                ble_device.address,
+                disconnected_callback=self._on_disconnected,
+            )
+            self._client = client
+        else:
+            _LOGGER.debug("Reusing connection to %s", ble_device.address)
+
+        if self._notify_char is None:
+            self._notify_char = await self._async_start_notify(client)
+        return client
+
+    async def _async_start_notify(
+        self, client: BleakClient
+    ) -> BleakGATTCharacteristic | str:
+        """Subscribe to temperature notifications.
+
+        The characteristic is resolved once per connection so Bleak doesn't
+        have to look the UUID up again when subscribing or unsubscribing.
+
+        Args:
+            client: The connected BleakClient.
+
+        Returns:
+            The subscribed characteristic, or its UUID if it wasn't found in
+            the service cache.
+        """
+        _LOGGER.debug("Connected, starting notification subscription")
+        char = (
+            client.services.get_characteristic(CHARACTERISTIC_UUID)
+            or CHARACTERISTIC_UUID
         )
         try:
-            _LOGGER.debug("Connected, starting notification subscription")
-            try:
-                await client.start_notify(CHARACTERISTIC_UUID, _on_notification)
-            except BleakError as err:
-                if "Notify acquired" in str(err):
-                    _LOGGER.debug(
-                        "Notification already subscribed, waiting briefly and retrying"
-                    )
-                    # Wait a moment for BlueZ to clean up previous subscription
-                    await asyncio.sleep(0.5)
-                    # Try to stop any existing subscription first
-                    try:
-                        await client.stop_notify(CHARACTERISTIC_UUID)
-                    except Exception:
-                        pass  # Ignore errors, subscription might not exist
-                    # Retry the subscription
-                    await client.start_notify(CHARACTERISTIC_UUID, _on_notification)
-                else:
-                    raise
-
-            try:
-                await asyncio.wait_for(
-                    reading_event.wait(), timeout=NOTIFICATION_TIMEOUT
+            await client.start_notify(char, self._on_notification)
+        except BleakError as err:
+            if "Notify acquired" in str(err):
+                _LOGGER.debug(
+                    "Notification already subscribed, waiting briefly and retrying"
                 )
-                _LOGGER.debug("Notification received successfully")
-            finally:
+                # Wait a moment for BlueZ to clean up previous subscription
+                await asyncio.sleep(0.5)
+                # Try to stop any existing subscription first
                 try:
-                    await client.stop_notify(CHARACTERISTIC_UUID)
-                except Exception as err:
-                    _LOGGER.debug("Error stopping notifications: %s", err)
-        finally:
+                    await client.stop_notify(char)
+                except Exception:
+                    pass  # Ignore errors, subscription might not exist
+                # Retry the subscription
+                await client.start_notify(char, self._on_notification)
+            else:
+                raise
+        return char
+
+    def _on_notification(
+        self, _sender: BleakGATTCharacteristic, data: bytearray
+    ) -> None:
+        """Queue a raw temperature notification; parsing happens in the poll."""
+        self._raw_queue.put_nowait(data)
+
+    def _on_disconnected(self, client: BleakClient) -> None:
+        """Forget a connection that was dropped by the device or stack."""
+        if client is not self._client:
+            return
+        _LOGGER.debug("Connection to %s lost", self.get_device_name())
+        self._cancel_idle_timer()
+        self._reset_connection_state()
+
+    def _reset_connection_state(
+        self,
+    ) -> tuple[BleakClient | None, BleakGATTCharacteristic | str | None]:
+        """Forget the current connection and anything queued on it.
+
+        Readings queued on a previous connection are stale by the next poll.
+        The old queue is ended so a poll waiting on it fails right away
+        instead of running into NOTIFICATION_TIMEOUT.
+
+        Returns:
+            The detached client and its subscribed characteristic, if any.
+        """
+        client, self._client = self._client, None
+        notify_char, self._notify_char = self._notify_char, None
+        self._raw_queue.put_nowait(None)
+        self._raw_queue = asyncio.Queue()
+        return client, notify_char
+
+    def _schedule_idle_disconnect(self) -> None:
+        """(Re)start the idle timer for an open connection."""
+        self._cancel_idle_timer()
+        if self._client is None:
+            return
+        self._idle_timer = asyncio.get_running_loop().call_later(
+            IDLE_DISCONNECT_TIMEOUT, self._async_idle_disconnect
+        )
+
+    def _cancel_idle_timer(self) -> None:
+        """Cancel a pending idle disconnect, if any."""
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _async_idle_disconnect(self) -> None:
+        """Close the connection after it has sat idle."""
+        self._idle_timer = None
+        _LOGGER.debug("Connection idle, disconnecting")
+        self._start_disconnect()
+
+    def _start_disconnect(self) -> None:
+        """Detach the current client and tear it down in the background.
+
+        The client is detached synchronously so a new poll never reuses it,
+        while the unsubscribe/disconnect round-trips don't hold up the caller.
+        """
+        client, notify_char = self._reset_connection_state()
+        if client is None:
+            return
+        self._disconnect_task = asyncio.get_running_loop().create_task(
+            self._async_teardown(client, notify_char)
+        )
+
+    async def _async_wait_disconnected(self) -> None:
+        """Wait for a background disconnect to finish, if one is running."""
+        if self._disconnect_task is not None:
+            await self._disconnect_task
+            self._disconnect_task = None
+
+    async def _async_teardown(
+        self,
+        client: BleakClient,
+        notify_char: BleakGATTCharacteristic | str | None,
+    ) -> None:
+        """Unsubscribe and disconnect a detached client."""
+        if notify_char is not None:
             try:
-                await client.disconnect()
-                _LOGGER.debug("Disconnected from %s", ble_device.address)
+                await client.stop_notify(notify_char)
             except Exception as err:
-                _LOGGER.debug("Error during disconnect: %s", err)
-
-        assert reading is not None
-        return reading
+                _LOGGER.debug("Error stopping notifications: %s", err)
+        try:
+            await client.disconnect()
+            _LOGGER.debug("Disconnected from %s", client.address)
+        except Exception as err:
+            _LOGGER.debug("Error during disconnect: %s", err)
+
+    async def async_stop(self) -> None:
+        """Cancel the idle timer and close any open connection."""
+        self._cancel_idle_timer()
+        self._start_disconnect()
+        await self._async_wait_disconnected()
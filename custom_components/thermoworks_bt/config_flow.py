@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, ClassVar
 
 import voluptuous as vol
 
@@ -19,12 +19,21 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on cached support checks; BLE privacy addresses rotate, so the
+# cache is simply reset when it grows past this.
+SUPPORTED_CACHE_MAX_SIZE = 256
+
 
 class ThermoWorksConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for ThermoWorks Bluetooth devices."""
 
     VERSION = 1
 
+    # Maps (address, name) to the device name if supported, else None. Shared
+    # across flows so re-rendering the user step doesn't re-parse every
+    # advertisement in range.
+    _SUPPORTED_CACHE: ClassVar[dict[tuple[str, str | None], str | None]] = {}
+
     def __init__(self) -> None:
         self._discovery_info: BluetoothServiceInfoBleak | None = None
         self._discovered_device: ThermoWorksBluetoothDeviceData | None = None
@@ -47,10 +56,10 @@ class ThermoWorksConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Confirm bluetooth discovery."""
-        assert self._discovered_device is not None
-        assert self._discovery_info is not None
         device = self._discovered_device
         discovery_info = self._discovery_info
+        if device is None or discovery_info is None:
+            return self.async_abort(reason="not_supported")
         title = device.get_device_name() or discovery_info.name
         if user_input is not None:
             return self.async_create_entry(title=title, data={})
@@ -78,30 +87,35 @@ class ThermoWorksConfigFlow(ConfigFlow, domain=DOMAIN):
         _LOGGER.info("Config flow: Searching for ThermoWorks devices...")
         _LOGGER.debug("Current configured addresses: %s", current_addresses)
 
+        # Skip already configured or listed devices before doing any work.
+        known = frozenset(current_addresses).union(self._discovered_devices)
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+
+        candidates = (
+            discovery_info
+            for discovery_info in async_discovered_service_info(self.hass, False)
+            if discovery_info.address not in known
+        )
+
         discovered_count = 0
-        for discovery_info in async_discovered_service_info(self.hass, False):
+        for discovery_info in candidates:
             discovered_count += 1
             address = discovery_info.address
-            name = discovery_info.name
-            _LOGGER.debug(
-                "Checking discovered device: %s (%s)", name, address
-            )
-
-            if address in current_addresses or address in self._discovered_devices:
-                _LOGGER.debug("  Skipping: already configured or in list")
-                continue
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Checking discovered device: %s (%s)", discovery_info.name, address
+                )
 
-            device = ThermoWorksBluetoothDeviceData()
-            is_supported = device.supported(discovery_info)
-            _LOGGER.debug("  Is supported: %s", is_supported)
+            device_name = self._supported_device_name(discovery_info)
+            if debug_enabled:
+                _LOGGER.debug("  Is supported: %s", device_name is not None)
 
-            if is_supported:
-                device_name = device.get_device_name() or discovery_info.name
+            if device_name is not None:
                 self._discovered_devices[address] = device_name
                 _LOGGER.info("Found ThermoWorks device: %s (%s)", device_name, address)
 
         _LOGGER.info(
-            "Discovery complete: checked %d devices, found %d ThermoWorks devices",
+            "Discovery complete: checked %d new devices, found %d ThermoWorks devices",
             discovered_count,
             len(self._discovered_devices),
         )
@@ -115,3 +129,22 @@ class ThermoWorksConfigFlow(ConfigFlow, domain=DOMAIN):
                 {vol.Required(CONF_ADDRESS): vol.In(self._discovered_devices)}
             ),
         )
+
+    def _supported_device_name(
+        self, discovery_info: BluetoothServiceInfoBleak
+    ) -> str | None:
+        """Return the device name if the device is supported, else None."""
+        cache = self._SUPPORTED_CACHE
+        key = (discovery_info.address, discovery_info.name)
+        if key in cache:
+            return cache[key]
+
+        device = ThermoWorksBluetoothDeviceData()
+        device_name: str | None = None
+        if device.supported(discovery_info):
+            device_name = device.get_device_name() or discovery_info.name
+
+        if len(cache) >= SUPPORTED_CACHE_MAX_SIZE:
+            cache.clear()
+        cache[key] = device_name
+        return device_name
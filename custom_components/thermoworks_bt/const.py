@@ -3,4 +3,7 @@
 DOMAIN = "thermoworks_bt"
 
 # Polling interval in seconds for active BLE connections.
-DEFAULT_POLL_INTERVAL = 30
+DEFAULT_POLL_INTERVAL = 15
+
+# Upper bound in seconds for the poll interval after repeated failures.
+MAX_POLL_INTERVAL = 300
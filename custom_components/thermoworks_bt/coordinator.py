@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from datetime import datetime
 import logging
+from typing import TYPE_CHECKING
 
+from bleak.exc import BleakError
+from bluetooth_data_tools import monotonic_time_coarse
 from sensor_state_data import SensorUpdate
 
 from homeassistant.components.bluetooth import (
@@ -17,15 +21,25 @@ from homeassistant.components.bluetooth.active_update_processor import (
     ActiveBluetoothProcessorCoordinator,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 
 from .ble.parser import ThermoWorksBluetoothDeviceData
+from .const import DEFAULT_POLL_INTERVAL, DOMAIN, MAX_POLL_INTERVAL
+
+if TYPE_CHECKING:
+    from bleak.backends.device import BLEDevice
 
 _LOGGER = logging.getLogger(__name__)
 
-# Fallback polling interval when advertisements aren't triggering polls
-FALLBACK_POLL_INTERVAL = timedelta(seconds=60)
+# hass.data key for the per-adapter locks that serialize polls.
+ADAPTER_LOCKS = f"{DOMAIN}_adapter_locks"
+
+# Seconds a connectable BLEDevice lookup is reused across advertisements.
+BLE_DEVICE_CACHE_TTL = 5.0
+
+# Minimum seconds between advertisement debug log lines.
+ADVERTISEMENT_LOG_INTERVAL = 10.0
 
 
 class ThermoWorksCoordinator(
@@ -33,21 +47,37 @@ class ThermoWorksCoordinator(
 ):
     """Coordinator for ThermoWorks Bluetooth devices.
 
-    Uses ActiveBluetoothProcessorCoordinator to handle the connect-per-poll
-    pattern: advertisements trigger device identification, and periodic polls
-    connect via GATT to read temperature notifications.
+    Uses ActiveBluetoothProcessorCoordinator to handle polling: advertisements
+    trigger device identification, and periodic polls connect via GATT to read
+    temperature notifications.
+
+    HA's Bluetooth manager drops advertisements that repeat the previous one,
+    and a BlueDOT's advertisement never changes, so polls are also driven by a
+    timer that is re-armed after every poll attempt. The interval starts at
+    DEFAULT_POLL_INTERVAL and doubles (up to MAX_POLL_INTERVAL) after each
+    failed poll, so an out-of-range device is not hammered with connection
+    attempts. A successful poll resets the interval.
     """
 
     _data: ThermoWorksBluetoothDeviceData
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         address = entry.unique_id
-        assert address is not None
+        if address is None:
+            raise ValueError("Config entry has no device address")
         _LOGGER.info(
             "Initializing ThermoWorks coordinator for device %s", address
         )
         self._data = ThermoWorksBluetoothDeviceData()
+        # Bound once; checked on every advertisement.
+        self._poll_needed = self._data.poll_needed
         self._entry = entry
+        self._poll_interval = float(DEFAULT_POLL_INTERVAL)
+        self._consecutive_failures = 0
+        self._cached_ble_device: tuple[float, BLEDevice | None] | None = None
+        self._last_advertisement_log = 0.0
+        self._cancel_poll_timer: CALLBACK_TYPE | None = None
+        self._poll_timer_running = False
         super().__init__(
             hass=hass,
             logger=_LOGGER,
@@ -60,63 +90,58 @@ class ThermoWorksCoordinator(
         )
         _LOGGER.info("ThermoWorks coordinator initialized successfully")
 
-    def start_fallback_poll(self) -> None:
-        """Start fallback timer-based polling.
-
-        This ensures polling happens even if advertisements aren't coming through,
-        which can occur due to HA's advertisement deduplication or device behavior.
-        """
-        _LOGGER.info(
-            "Starting fallback polling timer (interval: %s)", FALLBACK_POLL_INTERVAL
-        )
-        self._entry.async_on_unload(
-            async_track_time_interval(
-                self.hass, self._async_timer_poll, FALLBACK_POLL_INTERVAL
-            )
-        )
+    @property
+    def poll_interval(self) -> float:
+        """Return the current minimum number of seconds between polls."""
+        return self._poll_interval
 
-    async def _async_timer_poll(self, _now) -> None:
-        """Fallback timer-triggered poll.
+    @property
+    def consecutive_failures(self) -> int:
+        """Return the number of polls that have failed in a row."""
+        return self._consecutive_failures
 
-        This is called periodically by the timer to ensure we get updates even if
-        advertisements aren't triggering polls.
-        """
-        from bleak.exc import BleakError
+    @callback
+    def async_start_poll_timer(self) -> CALLBACK_TYPE:
+        """Start timer-driven polling and return a callback that stops it."""
+        self._poll_timer_running = True
+        self._async_schedule_poll()
+        return self._async_stop_poll_timer
 
-        _LOGGER.debug("Fallback timer triggered, checking if poll is needed")
+    @callback
+    def _async_stop_poll_timer(self) -> None:
+        """Stop timer-driven polling."""
+        self._poll_timer_running = False
+        if self._cancel_poll_timer is not None:
+            self._cancel_poll_timer()
+            self._cancel_poll_timer = None
 
-        # Get the device to poll
-        device = async_ble_device_from_address(
-            self.hass, self.address, connectable=True
+    @callback
+    def _async_schedule_poll(self) -> None:
+        """(Re)arm the poll timer with the current poll interval."""
+        if self._cancel_poll_timer is not None:
+            self._cancel_poll_timer()
+            self._cancel_poll_timer = None
+        if not self._poll_timer_running:
+            return
+        self._cancel_poll_timer = async_call_later(
+            self.hass,
+            self._poll_interval,
+            HassJob(self._async_timer_poll, cancel_on_shutdown=True),
         )
 
-        if device is None:
-            _LOGGER.debug("Device not available for timer poll (out of range or off)")
-            # Mark entities as unavailable but keep them registered
-            self._mark_unavailable()
+    @callback
+    def _async_timer_poll(self, _now: datetime) -> None:
+        """Poll through the base class debouncer when the timer fires."""
+        self._cancel_poll_timer = None
+        if self.hass.is_stopping:
             return
-
-        # Manually trigger a poll
-        try:
-            _LOGGER.info("Executing timer-based poll for %s", self.address)
-            update = await self._data.async_poll(device)
-            # Push the update to registered processors (marks as available)
-            self.async_set_updated_data(update)
-            _LOGGER.debug("Timer poll completed successfully")
-        except (TimeoutError, asyncio.TimeoutError):
-            _LOGGER.debug("Timer poll timed out (device may be out of range or off)")
-            self._mark_unavailable()
-        except BleakError as err:
-            if "Failed to connect" in str(err) or "not found" in str(err):
-                _LOGGER.debug(
-                    "Timer poll failed: device unreachable (may be off or out of range)"
-                )
-            else:
-                _LOGGER.warning("Timer poll failed with Bluetooth error: %s", err)
-            self._mark_unavailable()
-        except Exception as err:
-            _LOGGER.warning("Timer poll failed: %s", err, exc_info=True)
+        if self._last_service_info is None or not self._async_get_ble_device():
+            _LOGGER.debug("Timer poll skipped: device not available for connection")
             self._mark_unavailable()
+            self._async_schedule_poll()
+            return
+        _LOGGER.debug("Poll timer fired for %s", self.address)
+        self._debounced_poll.async_schedule_call()
 
     @callback
     def _async_on_update(self, service_info: BluetoothServiceInfo) -> SensorUpdate:
@@ -125,12 +150,16 @@ class ThermoWorksCoordinator(
         Processes advertisements for device identification and RSSI tracking.
         Temperature data is NOT available from advertisements.
         """
-        _LOGGER.info(
-            "COORDINATOR CALLBACK: Advertisement received from %s (%s), RSSI: %d",
-            service_info.name,
-            service_info.address,
-            service_info.rssi,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            now = monotonic_time_coarse()
+            if now - self._last_advertisement_log >= ADVERTISEMENT_LOG_INTERVAL:
+                self._last_advertisement_log = now
+                _LOGGER.debug(
+                    "Advertisement received from %s (%s), RSSI: %d",
+                    service_info.name,
+                    service_info.address,
+                    service_info.rssi,
+                )
         return self._data.update(service_info)
 
     @callback
@@ -142,24 +171,75 @@ class ThermoWorksCoordinator(
             _LOGGER.debug("Poll skipped: Home Assistant is stopping")
             return False
 
-        if not self._data.poll_needed(service_info, last_poll):
+        if not self._poll_needed(service_info, last_poll, self._poll_interval):
             return False
 
-        device = async_ble_device_from_address(
-            self.hass, service_info.device.address, connectable=True
-        )
-        if not device:
+        if not self._async_get_ble_device():
             _LOGGER.debug("Poll skipped: device not available for connection")
             return False
 
         _LOGGER.debug("Poll will be initiated for %s", service_info.name)
         return True
 
+    @callback
+    def _async_get_ble_device(self) -> BLEDevice | None:
+        """Return the connectable BLEDevice, reusing a recent lookup."""
+        now = monotonic_time_coarse()
+        cached = self._cached_ble_device
+        if cached is not None and now - cached[0] < BLE_DEVICE_CACHE_TTL:
+            return cached[1]
+
+        device = async_ble_device_from_address(
+            self.hass, self.address, connectable=True
+        )
+        self._cached_ble_device = (now, device)
+        return device
+
     async def _async_poll_data(
         self, last_service_info: BluetoothServiceInfoBleak
     ) -> SensorUpdate:
-        """Poll the device via GATT connection for temperature data."""
-        return await self._data.async_poll(last_service_info.device)
+        """Poll the device via GATT connection for temperature data.
+
+        Polls from all configured devices on the same adapter are serialized
+        so they don't contend for it while connecting. Failures back off the
+        poll interval and mark entities unavailable before being re-raised
+        for the base class to log. Either way the poll timer is re-armed with
+        the resulting interval.
+        """
+        try:
+            async with self._adapter_lock(last_service_info.source):
+                update = await self._data.async_poll(last_service_info.device)
+        except (BleakError, TimeoutError):
+            self._consecutive_failures += 1
+            self._poll_interval = min(self._poll_interval * 2, MAX_POLL_INTERVAL)
+            self._cached_ble_device = None
+            _LOGGER.debug(
+                "Poll failed %d time(s) in a row, next poll in %.0fs",
+                self._consecutive_failures,
+                self._poll_interval,
+            )
+            self._mark_unavailable()
+            raise
+        else:
+            self._consecutive_failures = 0
+            self._poll_interval = float(DEFAULT_POLL_INTERVAL)
+        finally:
+            self._async_schedule_poll()
+
+        return update
+
+    def _adapter_lock(self, source: str) -> asyncio.Lock:
+        """Return the lock shared by all devices polled through an adapter."""
+        locks: dict[str, asyncio.Lock] = self.hass.data.setdefault(
+            ADAPTER_LOCKS, {}
+        )
+        if (lock := locks.get(source)) is None:
+            lock = locks[source] = asyncio.Lock()
+        return lock
+
+    async def async_stop(self) -> None:
+        """Close any GATT connection held open between polls."""
+        await self._data.async_stop()
 
     def _mark_unavailable(self) -> None:
         """Mark the device as unavailable.
@@ -168,5 +248,6 @@ class ThermoWorksCoordinator(
         preventing the 'no longer being provided' message.
         """
         _LOGGER.debug("Marking device as unavailable")
-        for processor in self._processors:
+        # Snapshot: a processor may unregister itself while handling this.
+        for processor in tuple(self._processors):
             processor.async_handle_unavailable()
@@ -0,0 +1,22 @@
+"""Diagnostics support for ThermoWorks Bluetooth devices."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import ThermoWorksConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ThermoWorksConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    return {
+        "address": coordinator.address,
+        "poll_interval": coordinator.poll_interval,
+        "consecutive_failures": coordinator.consecutive_failures,
+        "last_poll_successful": coordinator.last_poll_successful,
+    }
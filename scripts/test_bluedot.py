@@ -20,11 +20,14 @@ from pathlib import Path
 
 # Allow running from project root without installing the package.
 # Import the BLE sub-package directly to avoid the HA-dependent parent __init__.
-_ble_path = Path(__file__).resolve().parent.parent / "custom_components" / "thermoworks"
+_ble_path = (
+    Path(__file__).resolve().parent.parent / "custom_components" / "thermoworks_bt"
+)
 sys.path.insert(0, str(_ble_path))
 
 from ble.bluedot import (  # noqa: E402
     CHARACTERISTIC_UUID,
+    is_bluedot,
     parse_notification_data,
 )
 
@@ -41,7 +44,7 @@ async def scan_for_bluedots(timeout: float = 10.0) -> None:
     devices = await BleakScanner.discover(timeout=timeout)
     found = False
     for device in devices:
-        if device.name and device.name.startswith("BlueDOT"):
+        if is_bluedot(device.name):
             print(f"  Found: {device.name} ({device.address})")
             found = True
     if not found:
@@ -77,7 +80,7 @@ async def connect_and_read(address: str, duration: float = 60.0) -> None:
             unit_str = "F" if reading.device_unit_fahrenheit else "C"
             probe_str = "connected" if reading.probe_connected else "DISCONNECTED"
             alarm_str = "ACTIVE" if reading.alarm_active else "inactive"
-            mac_str = ":".join(f"{b:02X}" for b in reading.mac_address)
+            mac_str = reading.mac_address.hex(":").upper()
 
             print(
                 f"[{reading_count:4d}] "
@@ -102,8 +105,9 @@ async def connect_and_read(address: str, duration: float = 60.0) -> None:
         await client.start_notify(CHARACTERISTIC_UUID, _on_notification)
 
         try:
-            await asyncio.wait_for(stop_event.wait(), timeout=duration)
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(duration):
+                await stop_event.wait()
+        except TimeoutError:
             print(f"\nDuration ({duration}s) reached.")
         finally:
             await client.stop_notify(CHARACTERISTIC_UUID)
@@ -2,42 +2,15 @@
 
 from __future__ import annotations
 
-import struct
-
 import pytest
 
 from custom_components.thermoworks_bt.ble.bluedot import (
-    NOTIFICATION_DATA_LENGTH,
     BlueDOTReading,
     is_bluedot,
     parse_notification_data,
 )
 
-
-def _build_payload(
-    *,
-    probe_status: int = 0x00,
-    temperature: int = 72,
-    alarm_temp: int = 150,
-    alarm_silenced: int = 0,
-    alarm_disabled: int = 0,
-    unit: int = 0x01,  # Fahrenheit by default to test conversion
-    unknown: int = 0,
-    mac: bytes = b"\xAA\xBB\xCC\xDD\xEE\xFF",
-    alarm_active: int = 0,
-) -> bytes:
-    """Build a 20-byte BlueDOT notification payload."""
-    data = bytearray(NOTIFICATION_DATA_LENGTH)
-    data[0] = probe_status
-    struct.pack_into("<i", data, 1, temperature)
-    struct.pack_into("<i", data, 5, alarm_temp)
-    data[9] = alarm_silenced
-    data[10] = alarm_disabled
-    data[11] = unit
-    data[12] = unknown
-    data[13:19] = mac
-    data[19] = alarm_active
-    return bytes(data)
+from ..payloads import build_notification_payload
 
 
 class TestParseNotificationData:
@@ -45,7 +18,7 @@ class TestParseNotificationData:
 
     def test_basic_fahrenheit_reading(self) -> None:
         """Test parsing a typical Fahrenheit reading and conversion to C."""
-        payload = _build_payload(temperature=72, unit=0x01)
+        payload = build_notification_payload(temperature=72, unit=0x01)
         reading = parse_notification_data(payload)
 
         assert reading.probe_connected is True
@@ -54,7 +27,7 @@ class TestParseNotificationData:
 
     def test_celsius_reading(self) -> None:
         """Test parsing a Celsius reading (no conversion needed)."""
-        payload = _build_payload(temperature=25, unit=0x00)
+        payload = build_notification_payload(temperature=25, unit=0x00)
         reading = parse_notification_data(payload)
 
         assert reading.temperature_celsius == 25.0
@@ -62,89 +35,109 @@ class TestParseNotificationData:
 
     def test_freezing_fahrenheit(self) -> None:
         """Test freezing point in Fahrenheit converts to 0 C."""
-        payload = _build_payload(temperature=32, unit=0x01)
+        payload = build_notification_payload(temperature=32, unit=0x01)
         reading = parse_notification_data(payload)
 
         assert reading.temperature_celsius == pytest.approx(0.0, abs=0.1)
 
     def test_negative_celsius(self) -> None:
         """Test negative Celsius temperature."""
-        payload = _build_payload(temperature=-10, unit=0x00)
+        payload = build_notification_payload(temperature=-10, unit=0x00)
         reading = parse_notification_data(payload)
 
         assert reading.temperature_celsius == -10.0
 
     def test_negative_fahrenheit(self) -> None:
         """Test negative Fahrenheit temperature converts correctly."""
-        payload = _build_payload(temperature=-4, unit=0x01)
+        payload = build_notification_payload(temperature=-4, unit=0x01)
         reading = parse_notification_data(payload)
 
         assert reading.temperature_celsius == pytest.approx(-20.0, abs=0.1)
 
+    def test_fahrenheit_outside_lookup_table(self) -> None:
+        """Test that out-of-range Fahrenheit values are still converted."""
+        for temperature, expected in ((-148, -100.0), (2012, 1100.0)):
+            payload = build_notification_payload(temperature=temperature, unit=0x01)
+            reading = parse_notification_data(payload)
+
+            assert reading.temperature_celsius == pytest.approx(expected, abs=0.1)
+
     def test_zero_celsius(self) -> None:
         """Test zero Celsius."""
-        payload = _build_payload(temperature=0, unit=0x00)
+        payload = build_notification_payload(temperature=0, unit=0x00)
         reading = parse_notification_data(payload)
 
         assert reading.temperature_celsius == 0.0
 
     def test_probe_disconnected(self) -> None:
         """Test probe disconnected status."""
-        payload = _build_payload(probe_status=0x03)
+        payload = build_notification_payload(probe_status=0x03)
         reading = parse_notification_data(payload)
 
         assert reading.probe_connected is False
 
     def test_probe_connected(self) -> None:
         """Test probe connected status."""
-        payload = _build_payload(probe_status=0x00)
+        payload = build_notification_payload(probe_status=0x00)
         reading = parse_notification_data(payload)
 
         assert reading.probe_connected is True
 
     def test_alarm_active(self) -> None:
         """Test alarm active state."""
-        payload = _build_payload(alarm_active=0x01)
+        payload = build_notification_payload(alarm_active=0x01)
         reading = parse_notification_data(payload)
 
         assert reading.alarm_active is True
 
     def test_alarm_inactive(self) -> None:
         """Test alarm inactive state."""
-        payload = _build_payload(alarm_active=0x00)
+        payload = build_notification_payload(alarm_active=0x00)
         reading = parse_notification_data(payload)
 
         assert reading.alarm_active is False
 
     def test_alarm_silenced(self) -> None:
         """Test alarm silenced flag."""
-        payload = _build_payload(alarm_silenced=0x01)
+        payload = build_notification_payload(alarm_silenced=0x01)
         reading = parse_notification_data(payload)
 
         assert reading.alarm_silenced is True
 
     def test_alarm_disabled(self) -> None:
         """Test alarm disabled flag."""
-        payload = _build_payload(alarm_disabled=0x01)
+        payload = build_notification_payload(alarm_disabled=0x01)
         reading = parse_notification_data(payload)
 
         assert reading.alarm_disabled is True
 
     def test_alarm_temperature_conversion(self) -> None:
         """Test alarm temperature is also converted from F to C."""
-        payload = _build_payload(alarm_temp=212, unit=0x01)
+        payload = build_notification_payload(alarm_temp=212, unit=0x01)
         reading = parse_notification_data(payload)
 
+        assert reading.alarm_temperature_raw == 212
         assert reading.alarm_temperature_celsius == pytest.approx(100.0, abs=0.1)
 
     def test_mac_address(self) -> None:
         """Test MAC address is extracted correctly."""
         mac = b"\x11\x22\x33\x44\x55\x66"
-        payload = _build_payload(mac=mac)
+        payload = build_notification_payload(mac=mac)
         reading = parse_notification_data(payload)
 
         assert reading.mac_address == mac
 
+    def test_accepts_bytearray_and_memoryview(self) -> None:
+        """Test that bytes-like payloads parse without a copy by the caller."""
+        mac = b"\x11\x22\x33\x44\x55\x66"
+        payload = build_notification_payload(temperature=25, unit=0x00, mac=mac)
+
+        for data in (payload, memoryview(payload)):
+            reading = parse_notification_data(data)
+            assert reading.temperature_celsius == 25.0
+            assert reading.mac_address == mac
+            assert type(reading.mac_address) is bytes
+
     def test_wrong_length_raises(self) -> None:
         """Test that wrong payload length raises ValueError."""
         with pytest.raises(ValueError, match="Expected 20 bytes"):
@@ -162,7 +155,7 @@ class TestParseNotificationData:
 
     def test_frozen_dataclass(self) -> None:
         """Test that BlueDOTReading is immutable."""
-        payload = _build_payload()
+        payload = build_notification_payload()
         reading = parse_notification_data(payload)
 
         with pytest.raises(AttributeError):
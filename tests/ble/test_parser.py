@@ -3,81 +3,66 @@
 from __future__ import annotations
 
 import asyncio
-import struct
+from dataclasses import dataclass, field
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from bleak.exc import BleakError
 import pytest
+from sensor_state_data import SensorUpdate
 
-from custom_components.thermoworks_bt.ble.bluedot import NOTIFICATION_DATA_LENGTH
+from custom_components.thermoworks_bt.ble import parser
 from custom_components.thermoworks_bt.ble.parser import (
     ThermoWorksBluetoothDeviceData,
 )
 
+from ..payloads import build_notification_payload
 
-def _make_service_info(name: str = "BlueDOT", address: str = "AA:BB:CC:DD:EE:FF"):
-    """Create a mock BluetoothServiceInfoBleak."""
-    service_info = MagicMock()
-    service_info.name = name
-    service_info.address = address
-    service_info.rssi = -60
-    service_info.manufacturer_data = {}
-    service_info.service_data = {}
-    service_info.service_uuids = []
-    service_info.source = "local"
-    return service_info
-
-
-def _build_notification_payload(
-    *,
-    probe_status: int = 0x00,
-    temperature: int = 25,
-    alarm_temp: int = 100,
-    alarm_silenced: int = 0,
-    alarm_disabled: int = 0,
-    unit: int = 0x00,
-    mac: bytes = b"\xAA\xBB\xCC\xDD\xEE\xFF",
-    alarm_active: int = 0,
-) -> bytearray:
-    """Build a 20-byte notification payload."""
-    data = bytearray(NOTIFICATION_DATA_LENGTH)
-    data[0] = probe_status
-    struct.pack_into("<i", data, 1, temperature)
-    struct.pack_into("<i", data, 5, alarm_temp)
-    data[9] = alarm_silenced
-    data[10] = alarm_disabled
-    data[11] = unit
-    data[13:19] = mac
-    data[19] = alarm_active
-    return data
 
+@dataclass(slots=True)
+class _FakeServiceInfo:
+    """Stand-in for BluetoothServiceInfoBleak with the fields the parser reads."""
 
-class TestSupported:
-    """Tests for device support detection."""
+    name: str | None
+    address: str
+    rssi: int = -60
+    manufacturer_data: dict[int, bytes] = field(default_factory=dict)
+    service_data: dict[str, bytes] = field(default_factory=dict)
+    service_uuids: list[str] = field(default_factory=list)
+    source: str = "local"
 
-    def test_supported_bluedot(self) -> None:
-        """Test that BlueDOT device names are recognized."""
-        device = ThermoWorksBluetoothDeviceData()
-        info = _make_service_info(name="BlueDOT")
-        assert device.supported(info) is True
 
-    def test_supported_bluedot_with_suffix(self) -> None:
-        """Test BlueDOT name with suffix."""
-        device = ThermoWorksBluetoothDeviceData()
-        info = _make_service_info(name="BlueDOT 1234")
-        assert device.supported(info) is True
+def _make_service_info(
+    name: str | None = "BlueDOT", address: str = "AA:BB:CC:DD:EE:FF"
+) -> _FakeServiceInfo:
+    """Create a fake BluetoothServiceInfoBleak."""
+    return _FakeServiceInfo(name=name, address=address)
 
-    def test_not_supported_unknown_device(self) -> None:
-        """Test that unknown device names are rejected."""
-        device = ThermoWorksBluetoothDeviceData()
-        info = _make_service_info(name="SomeOtherDevice")
-        assert device.supported(info) is False
 
-    def test_not_supported_none_name(self) -> None:
-        """Test that None device name is rejected."""
+# Payloads shared by tests that don't need to vary them.
+_PAYLOAD_25C = bytes(build_notification_payload(temperature=25, unit=0x00))
+_PAYLOAD_ALARM = bytes(
+    build_notification_payload(probe_status=0x00, alarm_active=0x01, unit=0x00)
+)
+
+
+class TestSupported:
+    """Tests for device support detection."""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("BlueDOT", True),
+            ("BlueDOT 1234", True),
+            ("SomeOtherDevice", False),
+            (None, False),
+        ],
+    )
+    def test_supported(self, name: str | None, expected: bool) -> None:
+        """Test that only BlueDOT device names are recognized."""
+        # supported() records device metadata, so each case needs a new device.
         device = ThermoWorksBluetoothDeviceData()
-        info = _make_service_info(name="BlueDOT")
-        info.name = None
-        assert device.supported(info) is False
+        info = _make_service_info(name=name)
+        assert device.supported(info) is expected
 
 
 class TestStartUpdate:
@@ -144,6 +129,18 @@ class TestStartUpdate:
         )
         assert rssi2 == -65
 
+    def test_sets_device_metadata_once(self) -> None:
+        """Test that metadata is not re-applied on later advertisements."""
+        device = ThermoWorksBluetoothDeviceData()
+        info = _make_service_info(name="BlueDOT")
+        device.update(info)
+
+        with patch.object(device, "set_device_name") as mock_set_name:
+            result = device.update(info)
+
+        mock_set_name.assert_not_called()
+        assert list(result.devices.values())[0].name == "BlueDOT"
+
     def test_skips_non_bluedot(self) -> None:
         """Test that update() skips unknown devices."""
         device = ThermoWorksBluetoothDeviceData()
@@ -161,96 +158,110 @@ class TestPollNeeded:
         """Test that poll is needed on first call."""
         device = ThermoWorksBluetoothDeviceData()
         info = _make_service_info()
-        assert device.poll_needed(info, None) is True
+        assert device.poll_needed(info, None, 15.0) is True
 
-    @patch("custom_components.thermoworks_bt.ble.parser.monotonic_time_coarse")
-    def test_poll_not_needed_within_interval(self, mock_time: MagicMock) -> None:
+    def test_poll_not_needed_within_interval(self) -> None:
         """Test that poll is not needed within the minimum interval."""
         device = ThermoWorksBluetoothDeviceData()
-        mock_time.return_value = 110.0  # Current time
-
         info = _make_service_info()
-        last_poll = 100.0  # Last poll was 10 seconds ago
-        assert device.poll_needed(info, last_poll) is False
+        # Last poll was 10 seconds ago.
+        assert device.poll_needed(info, 10.0, 15.0) is False
 
-    @patch("custom_components.thermoworks_bt.ble.parser.monotonic_time_coarse")
-    def test_poll_needed_after_interval(self, mock_time: MagicMock) -> None:
+    def test_poll_needed_after_interval(self) -> None:
         """Test that poll is needed after the minimum interval."""
         device = ThermoWorksBluetoothDeviceData()
-        mock_time.return_value = 131.0  # Current time
+        info = _make_service_info()
+        # Last poll was 16 seconds ago.
+        assert device.poll_needed(info, 16.0, 15.0) is True
 
+    def test_poll_needed_follows_interval(self) -> None:
+        """Test that the same age is judged against the caller's interval."""
+        device = ThermoWorksBluetoothDeviceData()
         info = _make_service_info()
-        last_poll = 100.0  # Last poll was 31 seconds ago
-        assert device.poll_needed(info, last_poll) is True
+        assert device.poll_needed(info, 20.0, 15.0) is True
+        assert device.poll_needed(info, 20.0, 60.0) is False
+
+
+def _temperatures(update: SensorUpdate) -> list[float]:
+    """Return the temperature values in a sensor update."""
+    return [
+        value.native_value
+        for key, value in update.entity_values.items()
+        if "temperature" in key.key
+    ]
+
 
+@pytest.fixture
+def ble_device() -> MagicMock:
+    """Return a BLEDevice mock for the test address."""
+    device = MagicMock()
+    device.address = "AA:BB:CC:DD:EE:FF"
+    return device
 
+
+@pytest.fixture
+def mock_ble_client() -> AsyncMock:
+    """Return a connected BleakClient mock with sync service lookups."""
+    client = AsyncMock()
+    client.services = MagicMock()
+    client.stop_notify = AsyncMock()
+    client.disconnect = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def mock_establish_connection(
+    monkeypatch: pytest.MonkeyPatch, mock_ble_client: AsyncMock
+) -> AsyncMock:
+    """Make the parser's establish_connection return mock_ble_client."""
+    connect = AsyncMock(return_value=mock_ble_client)
+    monkeypatch.setattr(parser, "establish_connection", connect)
+    return connect
+
+
+@pytest.mark.usefixtures("mock_establish_connection")
 class TestAsyncPoll:
     """Tests for async_poll with mocked BLE."""
 
     @pytest.mark.asyncio
-    async def test_poll_returns_sensor_update(self) -> None:
+    async def test_poll_returns_sensor_update(
+        self, mock_ble_client: AsyncMock, ble_device: MagicMock
+    ) -> None:
         """Test that polling returns a SensorUpdate with temperature data."""
         device = ThermoWorksBluetoothDeviceData()
         # Pre-initialize device with an update call.
         info = _make_service_info(name="BlueDOT")
         device.update(info)
 
-        payload = _build_notification_payload(temperature=25, unit=0x00)
-        ble_device = MagicMock()
-        ble_device.address = "AA:BB:CC:DD:EE:FF"
-
-        mock_client = AsyncMock()
+        payload = _PAYLOAD_25C
 
         async def _mock_start_notify(uuid, callback):
             # Simulate receiving a notification.
             callback(0, payload)
 
-        mock_client.start_notify = _mock_start_notify
-        mock_client.stop_notify = AsyncMock()
-        mock_client.disconnect = AsyncMock()
+        mock_ble_client.start_notify = _mock_start_notify
 
-        with patch(
-            "custom_components.thermoworks_bt.ble.parser.establish_connection",
-            return_value=mock_client,
-        ):
-            result = await device.async_poll(ble_device)
+        result = await device.async_poll(ble_device)
 
-        assert result is not None
-        # Check that temperature sensor value is present.
-        found_temp = False
-        for key, value in result.entity_values.items():
-            if "temperature" in key.key:
-                assert value.native_value == 25.0
-                found_temp = True
-        assert found_temp, "Temperature sensor not found in update"
+        assert _temperatures(result) == [25.0]
 
     @pytest.mark.asyncio
-    async def test_poll_returns_binary_sensors(self) -> None:
+    async def test_poll_returns_binary_sensors(
+        self, mock_ble_client: AsyncMock, ble_device: MagicMock
+    ) -> None:
         """Test that polling returns binary sensor data."""
         device = ThermoWorksBluetoothDeviceData()
         info = _make_service_info(name="BlueDOT")
         device.update(info)
 
-        payload = _build_notification_payload(
-            probe_status=0x00, alarm_active=0x01, unit=0x00
-        )
-        ble_device = MagicMock()
-        ble_device.address = "AA:BB:CC:DD:EE:FF"
-
-        mock_client = AsyncMock()
+        payload = _PAYLOAD_ALARM
 
         async def _mock_start_notify(uuid, callback):
             callback(0, payload)
 
-        mock_client.start_notify = _mock_start_notify
-        mock_client.stop_notify = AsyncMock()
-        mock_client.disconnect = AsyncMock()
+        mock_ble_client.start_notify = _mock_start_notify
 
-        with patch(
-            "custom_components.thermoworks_bt.ble.parser.establish_connection",
-            return_value=mock_client,
-        ):
-            result = await device.async_poll(ble_device)
+        result = await device.async_poll(ble_device)
 
         # Check binary sensor values.
         binary_values = {
@@ -261,60 +272,209 @@ class TestAsyncPoll:
         assert binary_values.get("alarm_active") is True
 
     @pytest.mark.asyncio
-    async def test_poll_disconnects_on_success(self) -> None:
-        """Test that the client disconnects after successful poll."""
+    async def test_poll_uses_newest_notification(
+        self, mock_ble_client: AsyncMock, ble_device: MagicMock
+    ) -> None:
+        """Test that a burst of notifications yields the newest reading."""
+        device = ThermoWorksBluetoothDeviceData()
+        info = _make_service_info(name="BlueDOT")
+        device.update(info)
+
+        async def _mock_start_notify(uuid, callback):
+            for temperature in (20, 21, 22):
+                callback(0, build_notification_payload(temperature=temperature))
+
+        mock_ble_client.start_notify = _mock_start_notify
+
+        result = await device.async_poll(ble_device)
+
+        assert _temperatures(result) == [22.0]
+
+    @pytest.mark.asyncio
+    async def test_poll_skips_malformed_notification(
+        self, mock_ble_client: AsyncMock, ble_device: MagicMock
+    ) -> None:
+        """Test that malformed notifications are skipped, not returned."""
+        device = ThermoWorksBluetoothDeviceData()
+        info = _make_service_info(name="BlueDOT")
+        device.update(info)
+
+        payload = build_notification_payload(temperature=30)
+
+        callbacks = []
+
+        async def _mock_start_notify(uuid, callback):
+            callbacks.append(callback)
+            callback(0, bytearray(b"\x00" * 5))
+            asyncio.get_running_loop().call_soon(callback, 0, payload)
+
+        mock_ble_client.start_notify = _mock_start_notify
+
+        result = await device.async_poll(ble_device)
+
+        assert _temperatures(result) == [30.0]
+
+        # A valid reading followed by a garbled one falls back to the valid one
+        # instead of waiting for (and possibly timing out on) another.
+        callbacks[0](0, build_notification_payload(temperature=31))
+        callbacks[0](0, bytearray(b"\x00" * 5))
+        result = await device.async_poll(ble_device)
+
+        assert _temperatures(result) == [31.0]
+
+        await device.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_poll_keeps_connection_open(
+        self,
+        mock_ble_client: AsyncMock,
+        mock_establish_connection: AsyncMock,
+        ble_device: MagicMock,
+    ) -> None:
+        """Test that the connection is reused by the next poll."""
         device = ThermoWorksBluetoothDeviceData()
         info = _make_service_info(name="BlueDOT")
         device.update(info)
 
-        payload = _build_notification_payload(unit=0x00)
-        ble_device = MagicMock()
-        ble_device.address = "AA:BB:CC:DD:EE:FF"
+        payload = _PAYLOAD_25C
 
-        mock_client = AsyncMock()
+        mock_ble_client.is_connected = True
+        callbacks = []
 
         async def _mock_start_notify(uuid, callback):
+            callbacks.append(callback)
             callback(0, payload)
 
-        mock_client.start_notify = _mock_start_notify
-        mock_client.stop_notify = AsyncMock()
-        mock_client.disconnect = AsyncMock()
+        mock_ble_client.start_notify = _mock_start_notify
 
-        with patch(
-            "custom_components.thermoworks_bt.ble.parser.establish_connection",
-            return_value=mock_client,
-        ):
-            await device.async_poll(ble_device)
+        await device.async_poll(ble_device)
+        # Deliver the next notification once the second poll is waiting.
+        asyncio.get_running_loop().call_soon(callbacks[0], 0, payload)
+        await device.async_poll(ble_device)
+
+        mock_establish_connection.assert_called_once()
+        assert len(callbacks) == 1
+        mock_ble_client.disconnect.assert_not_called()
 
-        mock_client.disconnect.assert_called_once()
+        await device.async_stop()
+        # The characteristic resolved at subscribe time is reused to unsubscribe.
+        char = mock_ble_client.services.get_characteristic.return_value
+        mock_ble_client.stop_notify.assert_called_once_with(char)
+        mock_ble_client.disconnect.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_poll_disconnects_on_timeout(self) -> None:
-        """Test that the client disconnects even on timeout."""
+    async def test_poll_after_drop_ignores_stale_notifications(
+        self,
+        mock_ble_client: AsyncMock,
+        mock_establish_connection: AsyncMock,
+        ble_device: MagicMock,
+    ) -> None:
+        """Test that readings queued before a dropped link are discarded."""
         device = ThermoWorksBluetoothDeviceData()
         info = _make_service_info(name="BlueDOT")
         device.update(info)
 
-        ble_device = MagicMock()
-        ble_device.address = "AA:BB:CC:DD:EE:FF"
+        callbacks = []
+
+        async def _mock_start_notify(uuid, callback):
+            callbacks.append(callback)
+            if len(callbacks) == 1:
+                callback(0, build_notification_payload(temperature=21))
+            else:
+                # The new connection only sends its first reading later.
+                asyncio.get_running_loop().call_soon(
+                    callback, 0, build_notification_payload(temperature=22)
+                )
+
+        mock_ble_client.start_notify = _mock_start_notify
+
+        await device.async_poll(ble_device)
+        # A reading arrives after the poll, then the stack drops the link.
+        callbacks[0](0, build_notification_payload(temperature=99))
+        on_disconnected = mock_establish_connection.call_args.kwargs[
+            "disconnected_callback"
+        ]
+        on_disconnected(mock_ble_client)
+
+        result = await device.async_poll(ble_device)
+
+        assert mock_establish_connection.call_count == 2
+        assert _temperatures(result) == [22.0]
+
+        await device.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_poll_fails_fast_when_link_drops(
+        self,
+        mock_ble_client: AsyncMock,
+        mock_establish_connection: AsyncMock,
+        ble_device: MagicMock,
+    ) -> None:
+        """Test that a drop while waiting for a notification ends the poll."""
+        device = ThermoWorksBluetoothDeviceData()
+        info = _make_service_info(name="BlueDOT")
+        device.update(info)
+
+        async def _mock_start_notify(uuid, callback):
+            # The link drops once the poll is waiting, before any reading.
+            on_disconnected = mock_establish_connection.call_args.kwargs[
+                "disconnected_callback"
+            ]
+            asyncio.get_running_loop().call_soon(on_disconnected, mock_ble_client)
+
+        mock_ble_client.start_notify = _mock_start_notify
+
+        with pytest.raises(BleakError):
+            # Well below NOTIFICATION_TIMEOUT.
+            await asyncio.wait_for(device.async_poll(ble_device), 1)
+
+        await device.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_poll_disconnects_when_idle(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_ble_client: AsyncMock,
+        ble_device: MagicMock,
+    ) -> None:
+        """Test that an idle connection is closed by the idle timer."""
+        device = ThermoWorksBluetoothDeviceData()
+        info = _make_service_info(name="BlueDOT")
+        device.update(info)
+
+        payload = _PAYLOAD_25C
+
+        async def _mock_start_notify(uuid, callback):
+            callback(0, payload)
+
+        mock_ble_client.start_notify = _mock_start_notify
+        monkeypatch.setattr(parser, "IDLE_DISCONNECT_TIMEOUT", 0.01)
+
+        await device.async_poll(ble_device)
+        mock_ble_client.disconnect.assert_not_called()
+        await asyncio.sleep(0.05)
+
+        mock_ble_client.disconnect.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_poll_disconnects_on_timeout(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_ble_client: AsyncMock,
+        ble_device: MagicMock,
+    ) -> None:
+        """Test that the client disconnects even on timeout."""
+        device = ThermoWorksBluetoothDeviceData()
+        info = _make_service_info(name="BlueDOT")
+        device.update(info)
 
-        mock_client = AsyncMock()
         # Don't call the callback, so it times out.
-        mock_client.start_notify = AsyncMock()
-        mock_client.stop_notify = AsyncMock()
-        mock_client.disconnect = AsyncMock()
-
-        with (
-            patch(
-                "custom_components.thermoworks_bt.ble.parser.establish_connection",
-                return_value=mock_client,
-            ),
-            patch(
-                "custom_components.thermoworks_bt.ble.parser.NOTIFICATION_TIMEOUT",
-                0.1,
-            ),
-            pytest.raises(asyncio.TimeoutError),
-        ):
+        mock_ble_client.start_notify = AsyncMock()
+        monkeypatch.setattr(parser, "NOTIFICATION_TIMEOUT", 0.1)
+
+        with pytest.raises(asyncio.TimeoutError):
             await device.async_poll(ble_device)
 
-        mock_client.disconnect.assert_called_once()
+        # Teardown runs in the background; stopping waits for it to finish.
+        await device.async_stop()
+        mock_ble_client.disconnect.assert_called_once()
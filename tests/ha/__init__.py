@@ -12,6 +12,7 @@ def _make_bluetooth_service_info(
     manufacturer_data: dict | None = None,
     service_uuids: list | None = None,
     connectable: bool = True,
+    source: str = "local",
 ) -> BluetoothServiceInfoBleak:
     """Build a BluetoothServiceInfoBleak for testing."""
     return BluetoothServiceInfoBleak(
@@ -21,7 +22,7 @@ def _make_bluetooth_service_info(
         manufacturer_data=manufacturer_data or {},
         service_data={},
         service_uuids=service_uuids or [],
-        source="local",
+        source=source,
         device=BLEDevice(name=name, address=address, details={}),
         time=MONOTONIC_TIME(),
         advertisement=None,
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.thermoworks_bt.config_flow import ThermoWorksConfigFlow
 from custom_components.thermoworks_bt.const import DOMAIN
 
 
@@ -23,6 +27,14 @@ def auto_mock_bluetooth(mock_bluetooth):
     return mock_bluetooth
 
 
+@pytest.fixture(autouse=True)
+def clear_supported_cache():
+    """Keep the config flow's class-level support cache from leaking between tests."""
+    ThermoWorksConfigFlow._SUPPORTED_CACHE.clear()
+    yield
+    ThermoWorksConfigFlow._SUPPORTED_CACHE.clear()
+
+
 @pytest.fixture(autouse=True)
 def mock_bluetooth_setup():
     """Mock bluetooth and bluetooth_adapters setup to bypass hardware dependencies."""
@@ -34,12 +46,21 @@ def mock_bluetooth_setup():
         yield
 
 
-@pytest.fixture
-def mock_config_entry() -> MockConfigEntry:
-    """Return a mock config entry for a BlueDOT device."""
-    return MockConfigEntry(
-        domain=DOMAIN,
-        unique_id="9DC3DAD5-9E2C-0BEC-B420-14DCC706FB06",
-        title="BlueDOT",
-        data={},
+@pytest.fixture(scope="module")
+def mock_config_entry_kwargs() -> Mapping[str, Any]:
+    """Return the read-only constructor arguments for a BlueDOT config entry."""
+    return MappingProxyType(
+        {
+            "domain": DOMAIN,
+            "unique_id": "9DC3DAD5-9E2C-0BEC-B420-14DCC706FB06",
+            "title": "BlueDOT",
+        }
     )
+
+
+@pytest.fixture
+def mock_config_entry(mock_config_entry_kwargs: Mapping[str, Any]) -> MockConfigEntry:
+    """Return a fresh mock config entry for a BlueDOT device."""
+    # The entry's state mutates during a test, so it is never shared; only the
+    # kwargs are. data gets a new dict each time for the same reason.
+    return MockConfigEntry(**mock_config_entry_kwargs, data={})
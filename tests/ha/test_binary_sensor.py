@@ -0,0 +1,104 @@
+"""Tests for ThermoWorks binary sensor updates."""
+
+from __future__ import annotations
+
+import pytest
+from sensor_state_data import (
+    BinarySensorDescription,
+    BinarySensorDeviceClass,
+    BinarySensorValue,
+    DeviceKey,
+    SensorUpdate,
+)
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass as HABinarySensorDeviceClass,
+)
+from homeassistant.components.bluetooth.passive_update_processor import (
+    PassiveBluetoothEntityKey,
+)
+
+from custom_components.thermoworks_bt import binary_sensor
+from custom_components.thermoworks_bt.binary_sensor import (
+    binary_sensor_update_to_bluetooth_data_update,
+)
+
+PROBE_KEY = DeviceKey("probe_connected", None)
+ALARM_KEY = DeviceKey("alarm_active", None)
+PROBE_ENTITY_KEY = PassiveBluetoothEntityKey("probe_connected", None)
+ALARM_ENTITY_KEY = PassiveBluetoothEntityKey("alarm_active", None)
+
+
+@pytest.fixture(autouse=True)
+def clear_static_update_cache():
+    """Start every test with an empty description/name cache."""
+    binary_sensor._STATIC_UPDATE_CACHE.clear()
+    yield
+    binary_sensor._STATIC_UPDATE_CACHE.clear()
+
+
+def _binary_update(probe_connected: bool, alarm_active: bool) -> SensorUpdate:
+    """Build a SensorUpdate shaped like the one a poll produces."""
+    return SensorUpdate(
+        title=None,
+        devices={},
+        binary_entity_descriptions={
+            PROBE_KEY: BinarySensorDescription(
+                device_key=PROBE_KEY,
+                device_class=BinarySensorDeviceClass.CONNECTIVITY,
+            ),
+            ALARM_KEY: BinarySensorDescription(
+                device_key=ALARM_KEY,
+                device_class=BinarySensorDeviceClass.PROBLEM,
+            ),
+        },
+        binary_entity_values={
+            PROBE_KEY: BinarySensorValue(
+                device_key=PROBE_KEY, name="Probe", native_value=probe_connected
+            ),
+            ALARM_KEY: BinarySensorValue(
+                device_key=ALARM_KEY, name="Alarm", native_value=alarm_active
+            ),
+        },
+    )
+
+
+def test_update_reuses_descriptions_and_names() -> None:
+    """Test that only entity data is rebuilt for an update with the same keys."""
+    first = binary_sensor_update_to_bluetooth_data_update(_binary_update(True, False))
+    second = binary_sensor_update_to_bluetooth_data_update(_binary_update(False, True))
+
+    assert second.entity_descriptions is first.entity_descriptions
+    assert second.entity_names is first.entity_names
+    assert (
+        second.entity_descriptions[PROBE_ENTITY_KEY].device_class
+        is HABinarySensorDeviceClass.CONNECTIVITY
+    )
+    assert second.entity_names == {
+        PROBE_ENTITY_KEY: "Probe",
+        ALARM_ENTITY_KEY: "Alarm",
+    }
+
+    assert second.entity_data == {PROBE_ENTITY_KEY: False, ALARM_ENTITY_KEY: True}
+    # Values are never shared between updates.
+    assert first.entity_data == {PROBE_ENTITY_KEY: True, ALARM_ENTITY_KEY: False}
+
+
+def test_advertisement_update_does_not_poison_cache() -> None:
+    """Test that an update without binary sensors is cached separately."""
+    advertisement = binary_sensor_update_to_bluetooth_data_update(
+        SensorUpdate(title=None, devices={})
+    )
+    assert advertisement.entity_descriptions == {}
+    assert advertisement.entity_names == {}
+    assert advertisement.entity_data == {}
+
+    poll = binary_sensor_update_to_bluetooth_data_update(_binary_update(True, True))
+    assert set(poll.entity_descriptions) == {PROBE_ENTITY_KEY, ALARM_ENTITY_KEY}
+    assert poll.entity_data == {PROBE_ENTITY_KEY: True, ALARM_ENTITY_KEY: True}
+
+    advertisement = binary_sensor_update_to_bluetooth_data_update(
+        SensorUpdate(title=None, devices={})
+    )
+    assert advertisement.entity_descriptions == {}
+    assert advertisement.entity_data == {}
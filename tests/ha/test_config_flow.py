@@ -2,18 +2,26 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
+from custom_components.thermoworks_bt import config_flow
+from custom_components.thermoworks_bt.ble.parser import (
+    ThermoWorksBluetoothDeviceData,
+)
 from custom_components.thermoworks_bt.const import DOMAIN
 
 from . import BLUEDOT_SERVICE_INFO, NOT_THERMOWORKS_SERVICE_INFO
 
 
-async def test_bluetooth_discovery_valid_device(hass: HomeAssistant) -> None:
+async def test_bluetooth_discovery_valid_device(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test discovery via bluetooth with a BlueDOT device."""
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
@@ -23,12 +31,13 @@ async def test_bluetooth_discovery_valid_device(hass: HomeAssistant) -> None:
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "bluetooth_confirm"
 
-    with patch(
-        "custom_components.thermoworks_bt.async_setup_entry", return_value=True
-    ):
-        result2 = await hass.config_entries.flow.async_configure(
-            result["flow_id"], user_input={}
-        )
+    monkeypatch.setattr(
+        "custom_components.thermoworks_bt.async_setup_entry",
+        AsyncMock(return_value=True),
+    )
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={}
+    )
 
     assert result2["type"] is FlowResultType.CREATE_ENTRY
     assert result2["title"] == "BlueDOT"
@@ -57,22 +66,50 @@ async def test_user_step_no_devices_found(hass: HomeAssistant) -> None:
     assert result["reason"] == "no_devices_found"
 
 
-async def test_user_step_with_found_device(hass: HomeAssistant) -> None:
+async def test_user_step_with_found_device(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test user setup when a BlueDOT is discovered."""
-    with patch(
+    monkeypatch.setattr(
+        "custom_components.thermoworks_bt.config_flow.async_discovered_service_info",
+        MagicMock(return_value=[BLUEDOT_SERVICE_INFO]),
+    )
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_USER},
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "user"
+
+
+async def test_user_step_reuses_support_check(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a second user step doesn't re-check a cached device."""
+    monkeypatch.setattr(
         "custom_components.thermoworks_bt.config_flow.async_discovered_service_info",
-        return_value=[BLUEDOT_SERVICE_INFO],
-    ):
+        MagicMock(return_value=[BLUEDOT_SERVICE_INFO]),
+    )
+    mock_device_data = MagicMock(side_effect=ThermoWorksBluetoothDeviceData)
+    monkeypatch.setattr(
+        config_flow, "ThermoWorksBluetoothDeviceData", mock_device_data
+    )
+
+    for _ in range(2):
         result = await hass.config_entries.flow.async_init(
             DOMAIN,
             context={"source": config_entries.SOURCE_USER},
         )
+        assert result["type"] is FlowResultType.FORM
+        assert result["step_id"] == "user"
 
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "user"
+    mock_device_data.assert_called_once()
 
 
-async def test_already_configured(hass: HomeAssistant) -> None:
+async def test_already_configured(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that a second discovery for the same device aborts."""
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
@@ -81,12 +118,11 @@ async def test_already_configured(hass: HomeAssistant) -> None:
     )
     assert result["type"] is FlowResultType.FORM
 
-    with patch(
-        "custom_components.thermoworks_bt.async_setup_entry", return_value=True
-    ):
-        await hass.config_entries.flow.async_configure(
-            result["flow_id"], user_input={}
-        )
+    monkeypatch.setattr(
+        "custom_components.thermoworks_bt.async_setup_entry",
+        AsyncMock(return_value=True),
+    )
+    await hass.config_entries.flow.async_configure(result["flow_id"], user_input={})
 
     # Try to discover the same device again.
     result2 = await hass.config_entries.flow.async_init(
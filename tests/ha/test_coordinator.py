@@ -2,44 +2,258 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
 
+from bleak.exc import BleakError
 import pytest
+from sensor_state_data import SensorUpdate
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
-from custom_components.thermoworks_bt.const import DOMAIN
+from custom_components.thermoworks_bt import coordinator as coordinator_module
+from custom_components.thermoworks_bt.ble import parser as parser_module
+from custom_components.thermoworks_bt.const import (
+    DEFAULT_POLL_INTERVAL,
+    DOMAIN,
+    MAX_POLL_INTERVAL,
+)
+from custom_components.thermoworks_bt.coordinator import ThermoWorksCoordinator
 
-from . import BLUEDOT_SERVICE_INFO
+from ..payloads import build_notification_payload
+from . import BLUEDOT_SERVICE_INFO, _make_bluetooth_service_info
 
 
 async def test_coordinator_setup(
-    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test coordinator is created when entry is set up."""
     mock_config_entry.add_to_hass(hass)
 
-    with patch(
-        "custom_components.thermoworks_bt.coordinator.ThermoWorksCoordinator.async_start"
-    ):
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    # async_start is a callback returning an unsubscribe function.
+    monkeypatch.setattr(ThermoWorksCoordinator, "async_start", MagicMock())
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
 
     assert mock_config_entry.state.name == "LOADED"
     assert mock_config_entry.runtime_data is not None
 
 
 async def test_coordinator_unload(
-    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test coordinator is cleaned up on unload."""
     mock_config_entry.add_to_hass(hass)
 
-    with patch(
-        "custom_components.thermoworks_bt.coordinator.ThermoWorksCoordinator.async_start"
-    ):
-        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    monkeypatch.setattr(ThermoWorksCoordinator, "async_start", MagicMock())
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
 
     assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
     assert mock_config_entry.state.name == "NOT_LOADED"
+
+
+async def test_poll_failure_backs_off_interval(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that failed polls double the poll interval until one succeeds."""
+    mock_config_entry.add_to_hass(hass)
+    coordinator = ThermoWorksCoordinator(hass, mock_config_entry)
+    assert coordinator.poll_interval == DEFAULT_POLL_INTERVAL
+
+    monkeypatch.setattr(
+        coordinator._data, "async_poll", AsyncMock(side_effect=BleakError)
+    )
+    for _ in range(2):
+        with pytest.raises(BleakError):
+            await coordinator._async_poll_data(BLUEDOT_SERVICE_INFO)
+
+    assert coordinator.consecutive_failures == 2
+    assert coordinator.poll_interval == DEFAULT_POLL_INTERVAL * 4
+
+    monkeypatch.setattr(
+        coordinator._data, "async_poll", AsyncMock(side_effect=TimeoutError)
+    )
+    for _ in range(10):
+        with pytest.raises(TimeoutError):
+            await coordinator._async_poll_data(BLUEDOT_SERVICE_INFO)
+
+    assert coordinator.poll_interval == MAX_POLL_INTERVAL
+
+    monkeypatch.setattr(coordinator._data, "async_poll", AsyncMock())
+    await coordinator._async_poll_data(BLUEDOT_SERVICE_INFO)
+
+    assert coordinator.consecutive_failures == 0
+    assert coordinator.poll_interval == DEFAULT_POLL_INTERVAL
+
+
+async def test_timer_polls_at_adaptive_interval(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the poll timer keeps polling without new advertisements."""
+    mock_config_entry.add_to_hass(hass)
+    coordinator = ThermoWorksCoordinator(hass, mock_config_entry)
+    coordinator._last_service_info = BLUEDOT_SERVICE_INFO
+    monkeypatch.setattr(
+        coordinator_module,
+        "async_ble_device_from_address",
+        MagicMock(return_value=BLUEDOT_SERVICE_INFO.device),
+    )
+    mock_poll = AsyncMock(
+        side_effect=[BleakError, SensorUpdate(title=None, devices={})]
+    )
+    monkeypatch.setattr(coordinator._data, "async_poll", mock_poll)
+
+    async def _advance(seconds: float) -> None:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+        await hass.async_block_till_done()
+
+    stop_timer = coordinator.async_start_poll_timer()
+    await _advance(DEFAULT_POLL_INTERVAL)
+    assert mock_poll.await_count == 1
+    assert coordinator.poll_interval == DEFAULT_POLL_INTERVAL * 2
+
+    # The timer was re-armed with the backed-off interval.
+    await _advance(DEFAULT_POLL_INTERVAL)
+    assert mock_poll.await_count == 1
+    await _advance(DEFAULT_POLL_INTERVAL * 2)
+    assert mock_poll.await_count == 2
+    assert coordinator.poll_interval == DEFAULT_POLL_INTERVAL
+
+    stop_timer()
+    await _advance(MAX_POLL_INTERVAL)
+    assert mock_poll.await_count == 2
+
+
+async def test_scheduled_polls_reuse_connection(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that consecutive timer polls share one GATT connection."""
+    # Even after one failure the next poll must find the connection open.
+    assert DEFAULT_POLL_INTERVAL * 2 < parser_module.IDLE_DISCONNECT_TIMEOUT
+
+    mock_config_entry.add_to_hass(hass)
+    coordinator = ThermoWorksCoordinator(hass, mock_config_entry)
+    coordinator._last_service_info = BLUEDOT_SERVICE_INFO
+    monkeypatch.setattr(
+        coordinator_module,
+        "async_ble_device_from_address",
+        MagicMock(return_value=BLUEDOT_SERVICE_INFO.device),
+    )
+
+    notify_callbacks = []
+
+    async def _start_notify(char, callback) -> None:
+        notify_callbacks.append(callback)
+        callback(char, build_notification_payload(temperature=20))
+
+    client = MagicMock()
+    client.is_connected = True
+    client.services = MagicMock()
+    client.start_notify = AsyncMock(side_effect=_start_notify)
+    client.stop_notify = AsyncMock()
+    client.disconnect = AsyncMock()
+    establish = AsyncMock(return_value=client)
+    monkeypatch.setattr(parser_module, "establish_connection", establish)
+    poll_spy = AsyncMock(wraps=coordinator._data.async_poll)
+    monkeypatch.setattr(coordinator._data, "async_poll", poll_spy)
+
+    async def _advance(seconds: float) -> None:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+        await hass.async_block_till_done()
+
+    stop_timer = coordinator.async_start_poll_timer()
+    await _advance(DEFAULT_POLL_INTERVAL)
+    notify_callbacks[0](None, build_notification_payload(temperature=21))
+    await _advance(DEFAULT_POLL_INTERVAL)
+
+    assert poll_spy.await_count == 2
+    assert coordinator.consecutive_failures == 0
+    establish.assert_awaited_once()
+    client.start_notify.assert_awaited_once()
+
+    stop_timer()
+    await coordinator.async_stop()
+    client.disconnect.assert_awaited_once()
+
+
+async def test_needs_poll_reuses_ble_device_lookup(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the connectable device lookup is cached between adverts."""
+    mock_config_entry.add_to_hass(hass)
+    coordinator = ThermoWorksCoordinator(hass, mock_config_entry)
+
+    mock_lookup = MagicMock(return_value=BLUEDOT_SERVICE_INFO.device)
+    monkeypatch.setattr(
+        coordinator_module, "async_ble_device_from_address", mock_lookup
+    )
+    assert coordinator._async_needs_poll(BLUEDOT_SERVICE_INFO, None) is True
+    assert coordinator._async_needs_poll(BLUEDOT_SERVICE_INFO, None) is True
+
+    mock_lookup.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("second_source", "concurrent"),
+    [("local", False), ("hci1", True)],
+)
+async def test_polls_serialized_per_adapter(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+    second_source: str,
+    concurrent: bool,
+) -> None:
+    """Test that polls through one adapter wait for each other, others don't."""
+    mock_config_entry.add_to_hass(hass)
+    other_entry = MockConfigEntry(
+        domain=DOMAIN, unique_id="AA:BB:CC:DD:EE:01", title="BlueDOT", data={}
+    )
+    other_entry.add_to_hass(hass)
+    first = ThermoWorksCoordinator(hass, mock_config_entry)
+    second = ThermoWorksCoordinator(hass, other_entry)
+
+    started: list[str] = []
+    release = asyncio.Event()
+
+    def _blocking_poll(name: str):
+        async def _poll(ble_device):
+            started.append(name)
+            await release.wait()
+
+        return _poll
+
+    monkeypatch.setattr(first._data, "async_poll", _blocking_poll("first"))
+    monkeypatch.setattr(second._data, "async_poll", _blocking_poll("second"))
+    second_info = _make_bluetooth_service_info(
+        name="BlueDOT", address="AA:BB:CC:DD:EE:01", source=second_source
+    )
+
+    first_poll = asyncio.create_task(first._async_poll_data(BLUEDOT_SERVICE_INFO))
+    second_poll = asyncio.create_task(second._async_poll_data(second_info))
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert started == (["first", "second"] if concurrent else ["first"])
+
+    release.set()
+    await asyncio.gather(first_poll, second_poll)
+    assert started == ["first", "second"]
@@ -0,0 +1,50 @@
+"""Tests for ThermoWorks diagnostics."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+from bleak.exc import BleakError
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.thermoworks_bt.const import DEFAULT_POLL_INTERVAL
+from custom_components.thermoworks_bt.coordinator import ThermoWorksCoordinator
+from custom_components.thermoworks_bt.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+from . import BLUEDOT_SERVICE_INFO
+
+
+async def test_diagnostics_reports_poll_state(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that diagnostics reflect the coordinator's backoff state."""
+    mock_config_entry.add_to_hass(hass)
+    monkeypatch.setattr(ThermoWorksCoordinator, "async_start", MagicMock())
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+    assert diagnostics == {
+        "address": "9DC3DAD5-9E2C-0BEC-B420-14DCC706FB06",
+        "poll_interval": DEFAULT_POLL_INTERVAL,
+        "consecutive_failures": 0,
+        "last_poll_successful": True,
+    }
+
+    coordinator = mock_config_entry.runtime_data
+    monkeypatch.setattr(
+        coordinator._data, "async_poll", AsyncMock(side_effect=BleakError)
+    )
+    with pytest.raises(BleakError):
+        await coordinator._async_poll_data(BLUEDOT_SERVICE_INFO)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+    assert diagnostics["poll_interval"] == DEFAULT_POLL_INTERVAL * 2
+    assert diagnostics["consecutive_failures"] == 1
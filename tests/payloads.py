@@ -0,0 +1,38 @@
+"""BlueDOT notification payload builder shared by the BLE and HA tests."""
+
+from __future__ import annotations
+
+import struct
+
+from custom_components.thermoworks_bt.ble.bluedot import NOTIFICATION_DATA_LENGTH
+
+# Temperature and alarm temperature, packed together at offset 1.
+_TEMPERATURES_STRUCT = struct.Struct("<ii")
+
+
+def build_notification_payload(
+    *,
+    probe_status: int = 0x00,
+    temperature: int = 25,
+    alarm_temp: int = 100,
+    alarm_silenced: int = 0,
+    alarm_disabled: int = 0,
+    unit: int = 0x00,
+    unknown: int = 0,
+    mac: bytes = b"\xAA\xBB\xCC\xDD\xEE\xFF",
+    alarm_active: int = 0,
+) -> bytearray:
+    """Build a 20-byte BlueDOT notification payload.
+
+    The defaults describe a connected probe reading 25C with no alarm.
+    """
+    data = bytearray(NOTIFICATION_DATA_LENGTH)
+    data[0] = probe_status
+    _TEMPERATURES_STRUCT.pack_into(data, 1, temperature, alarm_temp)
+    data[9] = alarm_silenced
+    data[10] = alarm_disabled
+    data[11] = unit
+    data[12] = unknown
+    data[13:19] = mac
+    data[19] = alarm_active
+    return data